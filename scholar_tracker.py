@@ -12,21 +12,38 @@ from __future__ import annotations
 import argparse
 import json
 import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
-import matplotlib.pyplot as plt
-from scholarly import scholarly
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from scholarly import MaxTriesExceededException, scholarly  # noqa: E402
 
 DB_PATH = Path("scholar_history.db")
+DEFAULT_CONCURRENCY = 8
+SCHOLAR_MAX_RETRIES = 5
+SCHOLAR_REQUESTS_PER_SECOND = 4.0
+PUB_CACHE_TTL = timedelta(hours=12)
+
+T = TypeVar("T")
 
 
 @dataclass
 class PublicationSnapshot:
     title: str
     citation_count: int
+    pub_id: Optional[str] = None
+    # True only when scholarly.fill produced this entry; only those refresh pub_cache.
+    filled: bool = False
 
 
 @dataclass
@@ -40,45 +57,293 @@ class AuthorSnapshot:
     publications: list[PublicationSnapshot]
 
 
-def ensure_schema(conn: sqlite3.Connection) -> None:
+def open_db(path: Optional[Path] = None) -> sqlite3.Connection:
+    # A larger statement cache keeps every query this module issues prepared
+    # for the lifetime of the connection.
+    conn = sqlite3.connect(path or DB_PATH, cached_statements=256)
+    # WAL lets plots read while a fetch is writing, and with synchronous=NORMAL
+    # a commit costs a single WAL append instead of two fsyncs.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    return conn
+
+
+def create_snapshots_table(conn: sqlite3.Connection, name: str = "snapshots") -> None:
+    # captured_at is stored as unix epoch seconds (UTC).
     conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS snapshots (
+        f"""
+        CREATE TABLE IF NOT EXISTS {name} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             author_id TEXT NOT NULL,
             author_name TEXT,
-            captured_at TEXT NOT NULL,
+            captured_at INTEGER NOT NULL,
             total_citations INTEGER NOT NULL,
             hindex INTEGER,
             i10index INTEGER
         )
         """
     )
+
+
+def migrate_captured_at(conn: sqlite3.Connection) -> None:
+    column_types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(snapshots)")}
+    if column_types.get("captured_at", "INTEGER").upper() == "INTEGER":
+        return
+
+    # SQLite cannot change a column type in place, so rebuild the table from
+    # the old ISO text values. The savepoint keeps an interrupted migration
+    # from leaving the database without a snapshots table.
+    conn.execute("SAVEPOINT migrate_captured_at")
+    try:
+        create_snapshots_table(conn, "snapshots_new")
+        conn.execute(
+            """
+            INSERT INTO snapshots_new
+                (id, author_id, author_name, captured_at, total_citations, hindex, i10index)
+            SELECT id, author_id, author_name, CAST(strftime('%s', captured_at) AS INTEGER),
+                total_citations, hindex, i10index
+            FROM snapshots
+            """
+        )
+        conn.execute("DROP TABLE snapshots")
+        conn.execute("ALTER TABLE snapshots_new RENAME TO snapshots")
+    except BaseException:
+        conn.execute("ROLLBACK TO migrate_captured_at")
+        raise
+    finally:
+        conn.execute("RELEASE migrate_captured_at")
+
+
+def create_publication_snapshots_table(
+    conn: sqlite3.Connection, name: str = "publication_snapshots"
+) -> None:
     conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS publication_snapshots (
+        f"""
+        CREATE TABLE IF NOT EXISTS {name} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             snapshot_id INTEGER NOT NULL,
-            title TEXT NOT NULL,
+            publication_id INTEGER NOT NULL,
             citation_count INTEGER NOT NULL,
-            FOREIGN KEY(snapshot_id) REFERENCES snapshots(id)
+            FOREIGN KEY(snapshot_id) REFERENCES snapshots(id),
+            FOREIGN KEY(publication_id) REFERENCES publications(id)
+        )
+        """
+    )
+
+
+def migrate_publication_titles(conn: sqlite3.Connection) -> None:
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(publication_snapshots)")}
+    if "title" not in columns:
+        return
+
+    # Move the per-row title text into publications and rebuild
+    # publication_snapshots to reference it by id.
+    conn.execute("SAVEPOINT migrate_publication_titles")
+    try:
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO publications (author_id, title)
+            SELECT DISTINCT s.author_id, p.title
+            FROM publication_snapshots p
+            JOIN snapshots s ON s.id = p.snapshot_id
+            """
+        )
+        create_publication_snapshots_table(conn, "publication_snapshots_new")
+        conn.execute(
+            """
+            INSERT INTO publication_snapshots_new
+                (id, snapshot_id, publication_id, citation_count)
+            SELECT p.id, p.snapshot_id, pub.id, p.citation_count
+            FROM publication_snapshots p
+            JOIN snapshots s ON s.id = p.snapshot_id
+            JOIN publications pub ON pub.author_id = s.author_id AND pub.title = p.title
+            """
         )
+        conn.execute("DROP TABLE publication_snapshots")
+        conn.execute("ALTER TABLE publication_snapshots_new RENAME TO publication_snapshots")
+    except BaseException:
+        conn.execute("ROLLBACK TO migrate_publication_titles")
+        raise
+    finally:
+        conn.execute("RELEASE migrate_publication_titles")
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    create_snapshots_table(conn)
+    migrate_captured_at(conn)
+    conn.execute(
         """
+        CREATE TABLE IF NOT EXISTS publications (
+            id INTEGER PRIMARY KEY,
+            author_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            UNIQUE(author_id, title)
+        )
+        """
+    )
+    create_publication_snapshots_table(conn)
+    migrate_publication_titles(conn)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pub_cache (
+            author_id TEXT NOT NULL,
+            pub_id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            num_citations INTEGER NOT NULL,
+            fetched_at INTEGER NOT NULL
+        )
+        """
+    )
+    indexes = {
+        "ix_pub_snap": "publication_snapshots(snapshot_id)",
+        "ix_pub_cites": "publication_snapshots(publication_id, citation_count DESC)",
+        "ix_snap_captured": "snapshots(captured_at)",
+    }
+    for name, target in indexes.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
+# Token bucket shared by all threads talking to Google Scholar.
+class RateLimiter:
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Going negative reserves a future slot, so waiting threads queue up
+            # instead of all waking at once when the bucket refills.
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+scholar_rate_limiter = RateLimiter(SCHOLAR_REQUESTS_PER_SECOND)
+
+
+def call_with_retry(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    # Scholar answers throttling (429/503) by exhausting scholarly's own retries;
+    # back off exponentially before giving up on the request.
+    for attempt in range(SCHOLAR_MAX_RETRIES - 1):
+        scholar_rate_limiter.acquire()
+        try:
+            return fn(*args, **kwargs)
+        except MaxTriesExceededException:
+            time.sleep(min(60, 2**attempt))
+    scholar_rate_limiter.acquire()
+    return fn(*args, **kwargs)
+
+
+def fill_with_retry(pub: dict) -> dict:
+    return call_with_retry(scholarly.fill, pub)
+
+
+def load_pub_cache(
+    conn: sqlite3.Connection, author_id: str, max_age: timedelta = PUB_CACHE_TTL
+) -> dict[str, PublicationSnapshot]:
+    cutoff = datetime.now(timezone.utc) - max_age
+    rows = conn.execute(
+        """
+        SELECT pub_id, title, num_citations
+        FROM pub_cache
+        WHERE author_id = ? AND fetched_at >= ?
+        """,
+        (author_id, int(cutoff.timestamp())),
+    ).fetchall()
+    return {
+        pub_id: PublicationSnapshot(title=title, citation_count=int(num_citations), pub_id=pub_id)
+        for pub_id, title, num_citations in rows
+    }
+
+
+def save_pub_cache(conn: sqlite3.Connection, snapshot: AuthorSnapshot) -> None:
+    fetched_at = int(snapshot.captured_at.timestamp())
+    conn.executemany(
+        """
+        INSERT INTO pub_cache (author_id, pub_id, title, num_citations, fetched_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(pub_id) DO UPDATE SET
+            title = excluded.title,
+            num_citations = excluded.num_citations,
+            fetched_at = excluded.fetched_at
+        """,
+        (
+            (snapshot.author_id, p.pub_id, p.title, p.citation_count, fetched_at)
+            for p in snapshot.publications
+            if p.pub_id and p.filled
+        ),
     )
-    conn.commit()
 
 
-def fetch_author_snapshot(author_id: str) -> AuthorSnapshot:
-    author = scholarly.search_author_id(author_id)
-    author = scholarly.fill(author, sections=["basics", "indices", "counts", "publications"])
+def load_previous_citations(conn: sqlite3.Connection, author_id: str) -> dict[str, int]:
+    rows = conn.execute(
+        """
+        SELECT pub.title, p.citation_count
+        FROM publication_snapshots p
+        JOIN publications pub ON pub.id = p.publication_id
+        WHERE p.snapshot_id = (SELECT MAX(id) FROM snapshots WHERE author_id = ?)
+        """,
+        (author_id,),
+    ).fetchall()
+    return {title: int(citation_count) for title, citation_count in rows}
+
+
+def fetch_author_snapshot(
+    author_id: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: Optional[dict[str, PublicationSnapshot]] = None,
+    previous: Optional[dict[str, int]] = None,
+) -> AuthorSnapshot:
+    author = call_with_retry(scholarly.search_author_id, author_id)
+    author = call_with_retry(
+        scholarly.fill, author, sections=["basics", "indices", "counts", "publications"]
+    )
+
+    cache = cache or {}
+    previous = previous or {}
+    pubs = author.get("publications", [])
+    known: list[Optional[PublicationSnapshot]] = []
+    for pub in pubs:
+        pub_id = pub.get("author_pub_id")
+        # The profile listing already carries title and citation count; a full
+        # fill is only needed when the count moved since the last snapshot.
+        title = (pub.get("bib", {}).get("title") or "").strip()
+        citations = int(pub.get("num_citations", 0) or 0)
+        if pub_id in cache and cache[pub_id].citation_count == citations:
+            known.append(cache[pub_id])
+        elif title and previous.get(title) == citations:
+            known.append(PublicationSnapshot(title=title, citation_count=citations, pub_id=pub_id))
+        else:
+            known.append(None)
+
+    stale = [pub for pub, snapshot in zip(pubs, known) if snapshot is None]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        filled_pubs = list(executor.map(fill_with_retry, stale))
+    filled_iter = iter(filled_pubs)
 
     publications: list[PublicationSnapshot] = []
-    for pub in author.get("publications", []):
-        filled_pub = scholarly.fill(pub)
+    for pub, snapshot in zip(pubs, known):
+        if snapshot is not None:
+            publications.append(snapshot)
+            continue
+        pub_id = pub.get("author_pub_id")
+        filled_pub = next(filled_iter)
         bib = filled_pub.get("bib", {})
         title = (bib.get("title") or "Untitled").strip()
         citations = int(filled_pub.get("num_citations", 0) or 0)
-        publications.append(PublicationSnapshot(title=title, citation_count=citations))
+        publications.append(
+            PublicationSnapshot(title=title, citation_count=citations, pub_id=pub_id, filled=True)
+        )
 
     return AuthorSnapshot(
         author_id=author_id,
@@ -86,7 +351,7 @@ def fetch_author_snapshot(author_id: str) -> AuthorSnapshot:
         total_citations=int(author.get("citedby", 0) or 0),
         hindex=int(author.get("hindex", 0) or 0),
         i10index=int(author.get("i10index", 0) or 0),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=datetime.now(timezone.utc).replace(microsecond=0),
         publications=publications,
     )
 
@@ -101,162 +366,244 @@ def save_snapshot(conn: sqlite3.Connection, snapshot: AuthorSnapshot) -> int:
         (
             snapshot.author_id,
             snapshot.author_name,
-            snapshot.captured_at.isoformat(),
+            int(snapshot.captured_at.timestamp()),
             snapshot.total_citations,
             snapshot.hindex,
             snapshot.i10index,
         ),
     )
     snapshot_id = int(cur.lastrowid)
+    # executemany accepts any iterable and binds one row per step, so the rows
+    # are streamed from generators instead of materialized as lists.
+    cur.executemany(
+        "INSERT OR IGNORE INTO publications (author_id, title) VALUES (?, ?)",
+        ((snapshot.author_id, p.title) for p in snapshot.publications),
+    )
+    publication_ids = dict(
+        cur.execute(
+            "SELECT title, id FROM publications WHERE author_id = ?", (snapshot.author_id,)
+        ).fetchall()
+    )
     cur.executemany(
         """
-        INSERT INTO publication_snapshots (snapshot_id, title, citation_count)
+        INSERT INTO publication_snapshots (snapshot_id, publication_id, citation_count)
         VALUES (?, ?, ?)
         """,
-        [(snapshot_id, p.title, p.citation_count) for p in snapshot.publications],
+        ((snapshot_id, publication_ids[p.title], p.citation_count) for p in snapshot.publications),
     )
-    conn.commit()
     return snapshot_id
 
 
-def fetch_command(args: argparse.Namespace) -> None:
-    with sqlite3.connect(DB_PATH) as conn:
-        ensure_schema(conn)
-        snapshot = fetch_author_snapshot(args.author_id)
-        snapshot_id = save_snapshot(conn, snapshot)
-        print(
-            json.dumps(
-                {
-                    "snapshot_id": snapshot_id,
-                    "author": snapshot.author_name,
-                    "captured_at": snapshot.captured_at.isoformat(),
-                    "total_citations": snapshot.total_citations,
-                    "publication_count": len(snapshot.publications),
-                },
-                indent=2,
-            )
-        )
-
-
-def load_total_history(conn: sqlite3.Connection) -> Iterable[tuple[datetime, int]]:
-    rows = conn.execute(
+def load_total_history(conn: sqlite3.Connection) -> Iterable[tuple[int, int]]:
+    # Rows are (captured_at epoch seconds, total_citations), streamed straight
+    # from the cursor so callers can hand them to np.fromiter unconverted.
+    return conn.execute(
         """
         SELECT captured_at, total_citations
         FROM snapshots
-        ORDER BY datetime(captured_at)
+        ORDER BY captured_at
         """
-    ).fetchall()
-    for captured_at, total_citations in rows:
-        yield datetime.fromisoformat(captured_at), int(total_citations)
-
-
-def plot_total_command(args: argparse.Namespace) -> None:
-    with sqlite3.connect(DB_PATH) as conn:
-        ensure_schema(conn)
-        points = list(load_total_history(conn))
-
-    if not points:
-        raise SystemExit("No snapshots found. Run `fetch` first.")
-
-    dates = [p[0] for p in points]
-    totals = [p[1] for p in points]
-
-    plt.figure(figsize=(10, 5))
-    plt.plot(dates, totals, marker="o")
-    plt.title("Total Google Scholar Citations Over Time")
-    plt.xlabel("Date")
-    plt.ylabel("Total citations")
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    output = Path(args.output)
-    plt.savefig(output, dpi=160)
-    print(f"Saved: {output}")
+    )
 
 
 def load_publication_history(
     conn: sqlite3.Connection, top: Optional[int]
-) -> tuple[list[datetime], dict[str, list[int]]]:
-    snapshots = conn.execute(
-        """
-        SELECT id, captured_at
-        FROM snapshots
-        ORDER BY datetime(captured_at)
-        """
-    ).fetchall()
-    if not snapshots:
-        return [], {}
-
-    top_titles = None
+) -> tuple[np.ndarray, list[str], np.ndarray]:
+    # values[i] holds the citation series for titles[i], aligned with timeline.
+    # Rows are keyed by publication id; titles are only labels and may repeat.
+    # One LEFT JOIN keeps snapshots without (matching) publications on the timeline.
     if top:
-        top_titles = {
-            row[0]
-            for row in conn.execute(
-                """
-                SELECT title
+        query = """
+            WITH top AS (
+                SELECT publication_id
                 FROM publication_snapshots
-                GROUP BY title
+                GROUP BY publication_id
                 ORDER BY MAX(citation_count) DESC
                 LIMIT ?
-                """,
-                (top,),
-            ).fetchall()
-        }
-
-    timeline = [datetime.fromisoformat(row[1]) for row in snapshots]
-    series: dict[str, list[int]] = {}
-
-    for snap_idx, (snapshot_id, _) in enumerate(snapshots):
-        pubs = conn.execute(
+            )
+            SELECT s.id, s.captured_at, p.publication_id, pub.title, p.citation_count
+            FROM snapshots s
+            LEFT JOIN publication_snapshots p
+                ON p.snapshot_id = s.id
+                AND p.publication_id IN (SELECT publication_id FROM top)
+            LEFT JOIN publications pub ON pub.id = p.publication_id
+            ORDER BY s.captured_at, s.id
             """
-            SELECT title, citation_count
-            FROM publication_snapshots
-            WHERE snapshot_id = ?
-            """,
-            (snapshot_id,),
-        ).fetchall()
-
-        for title, _ in pubs:
-            if top_titles and title not in top_titles:
-                continue
-            series.setdefault(title, [0] * len(snapshots))
-
-        for title, citation_count in pubs:
-            if title in series:
-                series[title][snap_idx] = int(citation_count)
-
-    return timeline, series
-
+        params: tuple = (top,)
+    else:
+        query = """
+            SELECT s.id, s.captured_at, p.publication_id, pub.title, p.citation_count
+            FROM snapshots s
+            LEFT JOIN publication_snapshots p ON p.snapshot_id = s.id
+            LEFT JOIN publications pub ON pub.id = p.publication_id
+            ORDER BY s.captured_at, s.id
+            """
+        params = ()
+    rows = conn.execute(query, params).fetchall()
+    if not rows:
+        return np.array([], dtype="datetime64[s]"), [], np.zeros((0, 0), dtype=np.int32)
+
+    captured: list[int] = []
+    snap_index: dict[int, int] = {}
+    pub_index: dict[int, int] = {}
+    titles: list[str] = []
+    for snapshot_id, captured_at, publication_id, title, _ in rows:
+        if snapshot_id not in snap_index:
+            snap_index[snapshot_id] = len(captured)
+            captured.append(captured_at)
+        if publication_id is not None and publication_id not in pub_index:
+            pub_index[publication_id] = len(titles)
+            titles.append(title)
+
+    values = np.zeros((len(titles), len(captured)), dtype=np.int32)
+    for snapshot_id, _, publication_id, _, citation_count in rows:
+        if publication_id is not None:
+            values[pub_index[publication_id], snap_index[snapshot_id]] = citation_count
+
+    timeline = np.array(captured, dtype="datetime64[s]")
+    return timeline, titles, values
+
+
+class ScholarTracker:
+    # Holds one connection for its whole lifetime so scripts that fetch or plot
+    # repeatedly (e.g. a cron job over many authors) pay the connection, PRAGMA
+    # and schema setup cost once.
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.conn = open_db(path)
+        try:
+            ensure_schema(self.conn)
+        except BaseException:
+            self.conn.close()
+            raise
+
+    def __enter__(self) -> ScholarTracker:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Refresh planner statistics for the tables this connection touched,
+        # once there is data worth analyzing.
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+
+    def fetch(
+        self,
+        author_id: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        force_refresh: bool = False,
+    ) -> tuple[int, AuthorSnapshot]:
+        if force_refresh:
+            cache, previous = {}, {}
+        else:
+            cache = load_pub_cache(self.conn, author_id)
+            previous = load_previous_citations(self.conn, author_id)
+        snapshot = fetch_author_snapshot(author_id, concurrency, cache, previous)
+        # All inserts share one write transaction (and one fsync); the connection
+        # context manager commits it or rolls it back on error.
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            snapshot_id = save_snapshot(self.conn, snapshot)
+            save_pub_cache(self.conn, snapshot)
+        return snapshot_id, snapshot
+
+    def plot_total(self, output: Path) -> None:
+        points = np.fromiter(
+            load_total_history(self.conn),
+            dtype=[("captured_at", "datetime64[s]"), ("total", "i8")],
+        )
+        if not points.size:
+            raise LookupError("No snapshots found. Run `fetch` first.")
+
+        fig = plt.figure(figsize=(10, 5))
+        plt.plot(points["captured_at"], points["total"], marker="o", rasterized=True)
+        plt.title("Total Google Scholar Citations Over Time")
+        plt.xlabel("Date")
+        plt.ylabel("Total citations")
+        plt.grid(True, alpha=0.3)
+        fig.subplots_adjust(left=0.08, right=0.97, bottom=0.1, top=0.92)
+        plt.savefig(output, dpi=160)
+        plt.close(fig)
+
+    def plot_publications(self, output: Path, top: Optional[int] = None) -> None:
+        timeline, titles, values = load_publication_history(self.conn, top)
+        if not timeline.size or not titles:
+            raise LookupError("No publication data found. Run `fetch` first.")
+
+        fig = plt.figure(figsize=(12, 7))
+        for i, title in enumerate(titles):
+            plt.plot(timeline, values[i], marker="o", linewidth=1.5, label=title, rasterized=True)
+
+        plt.title("Citation Trend Per Publication")
+        plt.xlabel("Date")
+        plt.ylabel("Citations")
+        plt.grid(True, alpha=0.3)
+        if len(titles) <= 12:
+            plt.legend(fontsize=8)
+        fig.subplots_adjust(left=0.07, right=0.98, bottom=0.08, top=0.94)
+        plt.savefig(output, dpi=160)
+        plt.close(fig)
+
+
+def fetch_command(tracker: ScholarTracker, args: argparse.Namespace) -> None:
+    snapshot_id, snapshot = tracker.fetch(args.author_id, args.concurrency, args.force_refresh)
+    print(
+        json.dumps(
+            {
+                "snapshot_id": snapshot_id,
+                "author": snapshot.author_name,
+                "captured_at": snapshot.captured_at.isoformat(),
+                "total_citations": snapshot.total_citations,
+                "publication_count": len(snapshot.publications),
+            },
+            indent=2,
+        )
+    )
 
-def plot_publications_command(args: argparse.Namespace) -> None:
-    with sqlite3.connect(DB_PATH) as conn:
-        ensure_schema(conn)
-        timeline, series = load_publication_history(conn, args.top)
 
-    if not timeline or not series:
-        raise SystemExit("No publication data found. Run `fetch` first.")
+def plot_total_command(tracker: ScholarTracker, args: argparse.Namespace) -> None:
+    output = Path(args.output)
+    try:
+        tracker.plot_total(output)
+    except LookupError as exc:
+        raise SystemExit(str(exc)) from exc
+    print(f"Saved: {output}")
 
-    plt.figure(figsize=(12, 7))
-    for title, values in series.items():
-        plt.plot(timeline, values, marker="o", linewidth=1.5, label=title)
 
-    plt.title("Citation Trend Per Publication")
-    plt.xlabel("Date")
-    plt.ylabel("Citations")
-    plt.grid(True, alpha=0.3)
-    if len(series) <= 12:
-        plt.legend(fontsize=8)
-    plt.tight_layout()
+def plot_publications_command(tracker: ScholarTracker, args: argparse.Namespace) -> None:
     output = Path(args.output)
-    plt.savefig(output, dpi=160)
+    try:
+        tracker.plot_publications(output, args.top)
+    except LookupError as exc:
+        raise SystemExit(str(exc)) from exc
     print(f"Saved: {output}")
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Track Google Scholar citations daily.")
     sub = parser.add_subparsers(dest="command", required=True)
 
     fetch = sub.add_parser("fetch", help="Fetch and save a new snapshot")
     fetch.add_argument("--author-id", required=True, help="Google Scholar author ID")
+    fetch.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help="Number of publications to fetch in parallel",
+    )
+    fetch.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Re-fetch every publication, ignoring cached results",
+    )
     fetch.set_defaults(func=fetch_command)
 
     total = sub.add_parser("plot-total", help="Plot total citations over time")
@@ -274,7 +621,8 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
-    args.func(args)
+    with ScholarTracker() as tracker:
+        args.func(tracker, args)
 
 
 if __name__ == "__main__":